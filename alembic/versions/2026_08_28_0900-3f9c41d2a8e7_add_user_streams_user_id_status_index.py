@@ -0,0 +1,42 @@
+"""Add composite index on user_streams (user_id, status)
+
+Revision ID: 3f9c41d2a8e7
+Revises: 2025_01_28_0800_stream_provisioning
+Create Date: 2026-08-28 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c41d2a8e7'
+down_revision: Union[str, None] = '2025_01_28_0800_stream_provisioning'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # user_streams is not in the migration chain - it is created by
+    # init_db()/Base.metadata.create_all at app startup, which runs after
+    # alembic upgrade head. On a fresh database the table does not exist
+    # yet, so skip the index here; init_db() builds it from the model's
+    # __table_args__ instead.
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if inspector.has_table('user_streams'):
+        # Covers the per-user stream limit check (user_id = ? AND status IN (...))
+        op.create_index(
+            'ix_user_streams_user_id_status',
+            'user_streams',
+            ['user_id', 'status'],
+            unique=False
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if inspector.has_table('user_streams'):
+        op.drop_index('ix_user_streams_user_id_status', table_name='user_streams')
@@ -0,0 +1,53 @@
+"""Add covering indexes for track search filters
+
+Revision ID: 7b2d95c0f314
+Revises: 3f9c41d2a8e7
+Create Date: 2026-08-28 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2d95c0f314'
+down_revision: Union[str, None] = '3f9c41d2a8e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram index backs the ILIKE '%...%' artist search
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX idx_tracks_artist_trgm ON tracks "
+        "USING gin (artist gin_trgm_ops)"
+    )
+
+    # Genre + BPM range is the standard DJ filter combination
+    op.create_index('idx_tracks_genre_bpm', 'tracks', ['genre', 'bpm'], unique=False)
+
+    # Partial index: year filters always imply year IS NOT NULL
+    op.create_index(
+        'idx_tracks_year',
+        'tracks',
+        ['year'],
+        unique=False,
+        postgresql_where=sa.text('year IS NOT NULL')
+    )
+
+    # Newest-first listing / keyset pagination on created_at
+    op.create_index(
+        'idx_tracks_created_at_desc',
+        'tracks',
+        [sa.text('created_at DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tracks_created_at_desc', table_name='tracks')
+    op.drop_index('idx_tracks_year', table_name='tracks')
+    op.drop_index('idx_tracks_genre_bpm', table_name='tracks')
+    op.execute("DROP INDEX IF EXISTS idx_tracks_artist_trgm")
@@ -0,0 +1,49 @@
+"""Set DB-side now() defaults on stream provisioning timestamps
+
+Revision ID: c5e8d71b6f02
+Revises: 7b2d95c0f314
+Create Date: 2026-08-28 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8d71b6f02'
+down_revision: Union[str, None] = '7b2d95c0f314'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The provisioning models moved from Python-side default=datetime.utcnow to
+# server_default=func.now(); tables created by the 2025_01_28_0800 migration
+# predate that and have no default on either side, so inserts relying on the
+# old Python default would now write NULL. Guarded per column because the
+# 2025_01_28_0800 schema and the current models don't agree on every column
+# (e.g. stream_sessions.started_at only exists on init_db-created tables).
+_TIMESTAMP_COLUMNS = (
+    ('dedicated_streams', 'created_at'),
+    ('stream_sessions', 'started_at'),
+    ('stream_monitoring', 'recorded_at'),
+    ('shoutcast_servers', 'created_at'),
+)
+
+
+def _existing_columns():
+    inspector = sa.inspect(op.get_bind())
+    for table, column in _TIMESTAMP_COLUMNS:
+        if inspector.has_table(table) and any(
+            col['name'] == column for col in inspector.get_columns(table)
+        ):
+            yield table, column
+
+
+def upgrade() -> None:
+    for table, column in _existing_columns():
+        op.alter_column(table, column, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    for table, column in _existing_columns():
+        op.alter_column(table, column, server_default=None)
@@ -4,8 +4,11 @@ Railway-optimized configuration with environment variables
 """
 
 import os
+from functools import cached_property
 from typing import List
 
+from sqlalchemy.engine import make_url
+
 
 class Settings:
     def __init__(self):
@@ -30,8 +33,15 @@ class Settings:
             
         self.database_url = database_url
         
+        # PgBouncer support: point DATABASE_URL at the bouncer (port 6432,
+        # pool_mode=transaction) and set USE_PGBOUNCER=true. Transaction
+        # pooling multiplexes all uvicorn workers onto a small server-side
+        # pool, so each worker only needs a few local connections.
+        self.use_pgbouncer = os.getenv("USE_PGBOUNCER", "false").lower() == "true"
+
         # Database Pool Configuration (for PostgreSQL)
-        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", "10"))
+        default_pool_size = "5" if self.use_pgbouncer else "10"
+        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", default_pool_size))
         self.db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "20"))
         self.db_pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
         
@@ -80,6 +90,18 @@ class Settings:
         # Create upload directory if it doesn't exist
         os.makedirs(self.upload_dir, exist_ok=True)
 
+    @cached_property
+    def is_postgres(self) -> bool:
+        """Whether database_url points at PostgreSQL (any driver suffix).
+
+        Parsed once with SQLAlchemy's URL parser instead of substring
+        checks, which would also match unrelated URLs containing the word.
+        """
+        try:
+            return make_url(self.database_url).get_backend_name() == "postgresql"
+        except Exception:
+            return False
+
 
 # Global settings instance
 settings = Settings()
\ No newline at end of file
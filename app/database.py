@@ -31,20 +31,46 @@ class Base(DeclarativeBase):
 # Create async engine with PostgreSQL-specific settings
 engine_kwargs = {
     "echo": settings.debug,  # Log SQL queries in debug mode
-    "future": True
+    "future": True,
+    # Large enough that every table's INSERT/SELECT shape stays compiled
+    "query_cache_size": 1200
 }
 
 # Add PostgreSQL connection pool settings if using PostgreSQL
-if "postgresql" in settings.database_url:
+if settings.is_postgres:
     engine_kwargs.update({
         "pool_size": settings.db_pool_size,
         "max_overflow": settings.db_max_overflow,
         "pool_timeout": settings.db_pool_timeout,
         "pool_pre_ping": True,  # Verify connections before use
-        "pool_recycle": 3600,   # Recycle connections every hour
+        "pool_recycle": 1800,   # Recycle before Railway's proxy drops idle sockets
     })
 
-engine = create_async_engine(settings.database_url, **engine_kwargs)
+    # asyncpg: fail fast on dead endpoints and skip PG JIT compilation,
+    # which only pays off for long analytical queries
+    connect_args = {
+        "server_settings": {"jit": "off"},
+        "timeout": 10,
+    }
+
+    if settings.use_pgbouncer:
+        # PgBouncer transaction pooling breaks server-side prepared
+        # statements, so asyncpg's statement caches must be disabled
+        connect_args.update({
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        })
+
+    engine_kwargs["connect_args"] = connect_args
+
+# Enforce the asyncpg driver at engine construction. Settings already
+# rewrites Railway URLs, but a raw postgresql:// slipping through would
+# silently fall back to sync psycopg2.
+database_url = settings.database_url
+if database_url.startswith("postgresql://"):
+    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+engine = create_async_engine(database_url, **engine_kwargs)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
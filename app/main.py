@@ -89,6 +89,14 @@ async def startup_event():
     print(f"🚀 {settings.service_name} v{settings.service_version} started!")
     print(f"📚 API Documentation: http://{settings.server_host}:{settings.server_port}/api/docs")
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown"""
+    from .streams.services import close_cpp_controller_service
+    await close_cpp_controller_service()
+
+
 # Exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
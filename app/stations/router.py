@@ -146,7 +146,7 @@ async def upload_logo(
     
     # Delete old logo if exists
     if station.logo:
-        delete_file(station.logo)
+        await delete_file(station.logo)
     
     # Save new logo
     try:
@@ -183,7 +183,7 @@ async def upload_cover(
     
     # Delete old cover if exists
     if station.cover_image:
-        delete_file(station.cover_image)
+        await delete_file(station.cover_image)
     
     # Save new cover
     try:
@@ -3,7 +3,7 @@ OneStopRadio Dynamic Stream Models
 Extended models for dynamic stream provisioning and management
 """
 
-from sqlalchemy import String, Text, Integer, Boolean, DateTime, ForeignKey, JSON, Float, Enum
+from sqlalchemy import String, Text, Integer, Boolean, DateTime, ForeignKey, JSON, Float, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
@@ -36,7 +36,12 @@ class StreamQuality(str, enum.Enum):
 class UserStream(Base):
     """Dynamic user stream configuration"""
     __tablename__ = "user_streams"
-    
+
+    # Covers the per-user stream limit check (user_id = ? AND status IN (...))
+    __table_args__ = (
+        Index('ix_user_streams_user_id_status', 'user_id', 'status'),
+    )
+
     # Primary identification
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     stream_name: Mapped[str] = mapped_column(String(255), nullable=False)
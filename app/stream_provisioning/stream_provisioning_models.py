@@ -4,6 +4,7 @@ OneStopRadio - Dedicated Shoutcast Stream Management
 """
 
 from sqlalchemy import String, Text, Integer, Boolean, DateTime, ForeignKey, JSON, Enum
+from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
@@ -86,7 +87,7 @@ class DedicatedStream(Base):
     last_config_update: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
     # Activity tracking
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     activated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     last_connection: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     last_disconnect: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
@@ -122,7 +123,7 @@ class StreamSession(Base):
     session_key: Mapped[str] = mapped_column(String(255), nullable=False)
     
     # Timing
-    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     ended_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     duration_seconds: Mapped[Optional[float]] = mapped_column(Integer)
     
@@ -155,7 +156,7 @@ class StreamMonitoring(Base):
     stream_id: Mapped[str] = mapped_column(ForeignKey("dedicated_streams.id"), nullable=False)
     
     # Timestamp
-    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Listener metrics
     current_listeners: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -220,7 +221,7 @@ class ShoutcastServer(Base):
     health_status: Mapped[str] = mapped_column(String(50), default="unknown")
     
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
 
@@ -6,14 +6,14 @@ Dynamic provisioning and lifecycle management for user streams
 from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import secrets
 import string
 import httpx
 
-from ..database import get_db
+from ..database import get_db, AsyncSessionLocal
 from ..auth.dependencies import get_current_user
 from ..auth.models import User
 from ..stream_models import UserStream, StreamTemplate, MountPoint, StreamEvent, StreamStatus
@@ -26,8 +26,13 @@ from .schemas import (
     MountPointResponse,
     StreamAnalyticsResponse
 )
-from .services import StreamService, CppControllerService
-from .utils import generate_mount_point, generate_source_password, validate_stream_config
+from .services import StreamService, CppControllerService, get_cpp_controller_service
+from .utils import (
+    generate_mount_point,
+    generate_source_password,
+    invalidate_mount_point_availability,
+    validate_stream_config
+)
 
 router = APIRouter(prefix="/api/v1/streams", tags=["streams"])
 
@@ -132,24 +137,27 @@ async def create_stream(
         )
         db.add(mount_point_record)
         db.commit()
+
+        # The mount point is now taken; drop any cached availability result
+        invalidate_mount_point_availability(mount_point)
+
+        # Log stream creation event (Core insert - audit rows don't need
+        # ORM identity-map bookkeeping)
+        await db.execute(insert(StreamEvent), {
+            "stream_id": new_stream.id,
+            "user_id": current_user.id,
+            "event_type": "stream_created",
+            "message": f"Stream '{stream_data.stream_name}' created with mount point {mount_point}",
+            "severity": "info",
+            "source_service": "fastapi"
+        })
+        await db.commit()
         
-        # Log stream creation event
-        event = StreamEvent(
-            stream_id=new_stream.id,
-            user_id=current_user.id,
-            event_type="stream_created",
-            message=f"Stream '{stream_data.stream_name}' created with mount point {mount_point}",
-            severity="info",
-            source_service="fastapi"
-        )
-        db.add(event)
-        db.commit()
-        
-        # Trigger background provisioning
+        # Trigger background provisioning (task opens its own session so the
+        # request-scoped connection returns to the pool immediately)
         background_tasks.add_task(
             provision_stream_to_cpp_service,
-            new_stream.id,
-            db
+            new_stream.id
         )
         
         return StreamResponse.from_orm(new_stream)
@@ -265,30 +273,27 @@ async def update_stream(
         db.refresh(stream)
         
         # Log update event
-        event = StreamEvent(
-            stream_id=stream.id,
-            user_id=current_user.id,
-            event_type="stream_updated",
-            event_data={"updated_fields": list(update_data.keys()), "requires_restart": requires_restart},
-            message=f"Stream configuration updated. Restart required: {requires_restart}",
-            severity="info",
-            source_service="fastapi"
-        )
-        db.add(event)
-        db.commit()
+        await db.execute(insert(StreamEvent), {
+            "stream_id": stream.id,
+            "user_id": current_user.id,
+            "event_type": "stream_updated",
+            "event_data": {"updated_fields": list(update_data.keys()), "requires_restart": requires_restart},
+            "message": f"Stream configuration updated. Restart required: {requires_restart}",
+            "severity": "info",
+            "source_service": "fastapi"
+        })
+        await db.commit()
         
         # Trigger background configuration update
         if requires_restart and stream.status == StreamStatus.ACTIVE:
             background_tasks.add_task(
                 restart_stream_on_cpp_service,
-                stream.id,
-                db
+                stream.id
             )
         elif stream.status in [StreamStatus.READY, StreamStatus.ACTIVE]:
             background_tasks.add_task(
                 update_stream_config_on_cpp_service,
-                stream.id,
-                db
+                stream.id
             )
         
         return StreamResponse.from_orm(stream)
@@ -333,8 +338,7 @@ async def activate_stream(
     # Trigger background activation
     background_tasks.add_task(
         activate_stream_on_cpp_service,
-        stream.id,
-        db
+        stream.id
     )
     
     return StreamStatusResponse(
@@ -376,8 +380,7 @@ async def deactivate_stream(
     # Trigger background deactivation
     background_tasks.add_task(
         deactivate_stream_on_cpp_service,
-        stream.id,
-        db
+        stream.id
     )
     
     return StreamStatusResponse(
@@ -431,22 +434,20 @@ async def delete_stream(
         db.commit()
         
         # Log deletion event
-        event = StreamEvent(
-            stream_id=stream.id,
-            user_id=current_user.id,
-            event_type="stream_deleted",
-            message=f"Stream '{stream.stream_name}' deleted",
-            severity="info",
-            source_service="fastapi"
-        )
-        db.add(event)
-        db.commit()
+        await db.execute(insert(StreamEvent), {
+            "stream_id": stream.id,
+            "user_id": current_user.id,
+            "event_type": "stream_deleted",
+            "message": f"Stream '{stream.stream_name}' deleted",
+            "severity": "info",
+            "source_service": "fastapi"
+        })
+        await db.commit()
         
         # Trigger background cleanup
         background_tasks.add_task(
             cleanup_stream_on_cpp_service,
-            stream.id,
-            db
+            stream.id
         )
         
         return {"message": "Stream deleted successfully"}
@@ -483,7 +484,7 @@ async def get_stream_status(
     
     # Query C++ service for live status
     try:
-        cpp_service = CppControllerService()
+        cpp_service = get_cpp_controller_service()
         live_status = await cpp_service.get_stream_status(stream.id)
         
         return StreamStatusResponse(
@@ -550,37 +551,45 @@ async def get_available_mount_points(
 
 
 # Background task functions
-async def provision_stream_to_cpp_service(stream_id: str, db: Session):
+# These run after the HTTP response is sent, so they must not reuse the
+# request-scoped session - each opens a short-lived session of its own.
+async def provision_stream_to_cpp_service(stream_id: str):
     """Background task to provision stream on C++ service"""
-    # Implementation for C++ service integration
-    pass
+    async with AsyncSessionLocal() as session:
+        # Implementation for C++ service integration
+        pass
 
 
-async def activate_stream_on_cpp_service(stream_id: str, db: Session):
+async def activate_stream_on_cpp_service(stream_id: str):
     """Background task to activate stream on C++ service"""
-    # Implementation for C++ service integration
-    pass
+    async with AsyncSessionLocal() as session:
+        # Implementation for C++ service integration
+        pass
 
 
-async def deactivate_stream_on_cpp_service(stream_id: str, db: Session):
+async def deactivate_stream_on_cpp_service(stream_id: str):
     """Background task to deactivate stream on C++ service"""
-    # Implementation for C++ service integration
-    pass
+    async with AsyncSessionLocal() as session:
+        # Implementation for C++ service integration
+        pass
 
 
-async def restart_stream_on_cpp_service(stream_id: str, db: Session):
+async def restart_stream_on_cpp_service(stream_id: str):
     """Background task to restart stream on C++ service"""
-    # Implementation for C++ service integration
-    pass
+    async with AsyncSessionLocal() as session:
+        # Implementation for C++ service integration
+        pass
 
 
-async def update_stream_config_on_cpp_service(stream_id: str, db: Session):
+async def update_stream_config_on_cpp_service(stream_id: str):
     """Background task to update stream config on C++ service"""
-    # Implementation for C++ service integration
-    pass
+    async with AsyncSessionLocal() as session:
+        # Implementation for C++ service integration
+        pass
 
 
-async def cleanup_stream_on_cpp_service(stream_id: str, db: Session):
+async def cleanup_stream_on_cpp_service(stream_id: str):
     """Background task to cleanup stream on C++ service"""
-    # Implementation for C++ service integration
-    pass
\ No newline at end of file
+    async with AsyncSessionLocal() as session:
+        # Implementation for C++ service integration
+        pass
\ No newline at end of file
@@ -3,9 +3,21 @@ Stream Management Services
 Business logic for dynamic stream provisioning and management
 """
 
+import asyncio
+import base64
 import httpx
+import ijson
+import numpy as np
+import orjson
+import os
+import random
 import secrets
 import string
+import threading
+import time
+import zstandard
+from cachetools import TTLCache
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
@@ -17,6 +29,94 @@ from .schemas import StreamConfigValidation
 
 logger = logging.getLogger(__name__)
 
+# httpx decompresses gzip transparently; zstd responses are decoded here
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+# Field mapping for FastAPI -> C++ config conversion, built once at import:
+# (cpp_key, fastapi_key, converter, default). Converter is None for
+# pass-through fields that need no coercion.
+_CPP_FIELD_SPEC = (
+    ("stream_id", "stream_id", None, ""),
+    ("user_id", "user_id", None, ""),
+    ("mount_point", "mount_point", None, ""),
+    ("source_password", "source_password", None, ""),
+    ("station_name", "station_name", None, ""),
+    ("description", "description", None, ""),
+    ("genre", "genre", None, "Various"),
+    ("quality", "bitrate", int, 128),
+    ("max_listeners", "max_listeners", int, 100),
+    ("server_host", "server_host", None, "localhost"),
+    ("server_port", "server_port", int, 8000),
+    ("protocol", "protocol", None, "icecast"),
+    ("format", "format", None, "MP3"),
+    ("public_stream", "public_stream", None, True),
+)
+
+# Relative path templates for the C++ controller API. Single-argument
+# %-substitution is cheaper than building an f-string per call on these
+# high-QPS paths, and the client's base_url supplies the host.
+_STREAM_PATHS = {
+    "detail": "/api/v1/streams/%s",
+    "activate": "/api/v1/streams/%s/activate",
+    "deactivate": "/api/v1/streams/%s/deactivate",
+    "status": "/api/v1/streams/%s/status",
+    "history": "/api/v1/streams/%s/history",
+    "batch_verb": "/api/v1/streams:batch/%s",
+}
+
+# C++ status codes -> FastAPI status names, indexed by code. Tuple indexing
+# avoids rebuilding a dict on every status poll.
+_STATUS_NAMES = ("PENDING", "READY", "ACTIVE", "INACTIVE", "ERROR", "SUSPENDED", "DELETED")
+
+# Statuses that count against a user's stream limit
+_ACTIVE_STREAM_STATUSES = (StreamStatus.READY, StreamStatus.ACTIVE, StreamStatus.PENDING)
+
+# Bandwidth estimate: (bitrate kbps -> bytes/s) * 50% average listener
+# capacity * 12 hours/day * 30 days, expressed in GB. Folded into one
+# constant so the per-call math is a single multiply.
+_BANDWIDTH_GB_FACTOR = (1000 / 8) * 0.5 * 12 * 30 * 3600 / (1024 ** 3)
+
+
+class _EntropyPool:
+    """Prefilled OS-entropy buffer for minting stream tokens in bulk.
+
+    secrets.token_urlsafe() pulls from the OS entropy source on every call;
+    during bulk provisioning that is one syscall per credential. This pool
+    reads 4KB of os.urandom at a time and slices tokens out of it, refilling
+    only when the buffer runs low.
+    """
+
+    __slots__ = ("_buf", "_pos", "_lock")
+
+    REFILL_SIZE = 4096
+
+    def __init__(self):
+        self._buf = os.urandom(self.REFILL_SIZE)
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def take(self, nbytes: int) -> bytes:
+        """Take nbytes of raw entropy from the pool"""
+        with self._lock:
+            if self._pos + nbytes > len(self._buf):
+                self._buf = os.urandom(max(self.REFILL_SIZE, nbytes))
+                self._pos = 0
+            chunk = self._buf[self._pos:self._pos + nbytes]
+            self._pos += nbytes
+            return chunk
+
+    def token_urlsafe(self, nbytes: int = 16) -> str:
+        """URL-safe token from pooled entropy (same shape as secrets.token_urlsafe)"""
+        return base64.urlsafe_b64encode(self.take(nbytes)).rstrip(b"=").decode("ascii")
+
+
+_entropy_pool = _EntropyPool()
+
+
+def generate_stream_token(nbytes: int = 16) -> str:
+    """Mint a URL-safe stream credential token from the shared entropy pool"""
+    return _entropy_pool.token_urlsafe(nbytes)
+
 
 class StreamService:
     """Core stream management business logic"""
@@ -24,35 +124,42 @@ class StreamService:
     @staticmethod
     def validate_stream_limits(user_id: str, db: Session) -> bool:
         """Check if user can create additional streams"""
-        
-        active_streams = db.query(UserStream).filter(
-            UserStream.user_id == user_id,
-            UserStream.status.in_([StreamStatus.READY, StreamStatus.ACTIVE, StreamStatus.PENDING])
-        ).count()
-        
+
         # TODO: Make configurable per user plan/subscription
         MAX_STREAMS = 5
+
+        # We only need to know whether the user is at the limit, so cap the
+        # scan at MAX_STREAMS rows instead of counting every matching stream
+        active_streams = db.query(UserStream.id).filter(
+            UserStream.user_id == user_id,
+            UserStream.status.in_(_ACTIVE_STREAM_STATUSES)
+        ).limit(MAX_STREAMS).count()
+
         return active_streams < MAX_STREAMS
     
     @staticmethod
+    @lru_cache(maxsize=2048)
     def calculate_estimated_costs(bitrate: int, max_listeners: int) -> Dict[str, float]:
-        """Calculate estimated monthly costs for stream configuration"""
-        
+        """Calculate estimated monthly costs for stream configuration.
+
+        Results are memoized per (bitrate, max_listeners) — the input space
+        is tiny in practice — so callers must treat the returned dict as
+        read-only.
+        """
+
         # Base cost calculation (example pricing)
         # TODO: Make configurable based on actual hosting costs
         
         base_cost = 5.0  # Base monthly cost
         bitrate_multiplier = bitrate / 128.0  # Cost scales with quality
         listener_cost = max_listeners * 0.10  # Cost per potential listener
-        
+
         monthly_cost = base_cost * bitrate_multiplier + listener_cost
-        
+
         # Bandwidth estimation (very rough)
         # Assumes 50% average listener capacity, 12 hours/day streaming
-        avg_listeners = max_listeners * 0.5
-        hours_per_month = 12 * 30  # 12 hours/day * 30 days
-        bandwidth_gb = (bitrate * 1000 / 8) * avg_listeners * hours_per_month * 3600 / (1024**3)
-        
+        bandwidth_gb = bitrate * max_listeners * _BANDWIDTH_GB_FACTOR
+
         return {
             "monthly_cost_usd": round(monthly_cost, 2),
             "estimated_bandwidth_gb": round(bandwidth_gb, 2),
@@ -63,201 +170,374 @@ class StreamService:
             }
         }
 
+    @staticmethod
+    def calculate_estimated_costs_batch(bitrates, max_listeners) -> Dict[str, List[float]]:
+        """Vectorized cost estimates for many (bitrate, max_listeners) pairs.
+
+        Used for tier-comparison quotes where pricing several configurations
+        in one NumPy expression beats looping over the scalar version.
+        """
+
+        bitrates = np.asarray(bitrates, dtype=np.float64)
+        listeners = np.asarray(max_listeners, dtype=np.float64)
+
+        monthly_costs = 5.0 * (bitrates / 128.0) + listeners * 0.10
+        bandwidth_gb = bitrates * listeners * _BANDWIDTH_GB_FACTOR
+
+        return {
+            "monthly_cost_usd": np.round(monthly_costs, 2).tolist(),
+            "estimated_bandwidth_gb": np.round(bandwidth_gb, 2).tolist()
+        }
+
+
+class StreamControllerUnavailableError(Exception):
+    """Raised when the C++ controller circuit breaker is open"""
+    pass
+
+
+class _AsyncByteReader:
+    """Minimal async file-like adapter over an async byte iterator for ijson"""
+
+    def __init__(self, byte_iterator):
+        self._byte_iterator = byte_iterator
+
+    async def read(self, size=-1):
+        try:
+            return await self._byte_iterator.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def _zstd_aiter(byte_iterator):
+    """Incrementally decompress a zstd-encoded async byte stream.
+
+    httpx doesn't decode zstd itself, so compressed chunks are fed through
+    a streaming decompressor as they arrive - peak memory stays O(chunk).
+    Empty outputs are skipped because _AsyncByteReader treats b"" as EOF.
+    """
+    decompressor = _ZSTD_DECOMPRESSOR.decompressobj()
+    async for chunk in byte_iterator:
+        decompressed = decompressor.decompress(chunk)
+        if decompressed:
+            yield decompressed
+
 
 class CppControllerService:
     """Interface to C++ Stream Controller microservice"""
-    
+
+    # Circuit breaker: open after this many consecutive transport failures,
+    # then fail fast for RESET_TIMEOUT seconds instead of waiting out the
+    # 10s request timeout on every call while the C++ service is down
+    BREAKER_FAIL_MAX = 5
+    BREAKER_RESET_TIMEOUT = 30.0
+
+    # Transient errors worth retrying with backoff
+    RETRY_ATTEMPTS = 3
+    _RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ReadTimeout)
+
     def __init__(self):
         # Updated to use new C++ Stream Controller API port
         self.base_url = "http://localhost:8083"  # C++ Stream Controller port
         self.timeout = 10.0
-    
-    async def create_mount_point(self, stream_config: Dict[str, Any]) -> bool:
-        """Create mount point on Icecast server via C++ service"""
-        
-        try:
-            # Convert FastAPI config to C++ format
-            cpp_config = self._convert_to_cpp_config(stream_config)
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/streams",
-                    json=cpp_config
+        # Persistent pooled client: reuses TCP connections via HTTP keep-alive
+        # (and HTTP/2 multiplexing) instead of handshaking on every RPC
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http2=True,
+            # Negotiate compressed status payloads: ~3-5x fewer bytes on the
+            # wire for bulk status responses at negligible CPU cost
+            headers={"content-type": "application/json", "accept-encoding": "zstd, gzip"},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        # Short-lived caches: dashboards and liveness probes poll the same
+        # data many times per second, so duplicate calls within the TTL are
+        # served locally instead of re-hitting the C++ service
+        self._status_cache: TTLCache = TTLCache(maxsize=1024, ttl=1.0)
+        self._health_cache: TTLCache = TTLCache(maxsize=1, ttl=1.0)
+        # Single-flight map: concurrent polls for the same stream share one
+        # upstream request instead of issuing N identical GETs
+        self._status_inflight: Dict[str, asyncio.Future] = {}
+        # Circuit breaker state
+        self._breaker_failures = 0
+        self._breaker_opened_at: Optional[float] = None
+
+    async def _request(self, method: str, path: str, content: Optional[bytes] = None,
+                       timeout: Optional[float] = None) -> httpx.Response:
+        """Send one RPC with transient-error retries behind a circuit breaker.
+
+        Transient connect errors and read timeouts are retried with
+        exponential backoff plus jitter. After BREAKER_FAIL_MAX consecutive
+        transport failures the breaker opens and calls fail fast until
+        BREAKER_RESET_TIMEOUT has elapsed, when a single probe is let through.
+        """
+
+        if self._breaker_opened_at is not None:
+            if time.monotonic() - self._breaker_opened_at < self.BREAKER_RESET_TIMEOUT:
+                raise StreamControllerUnavailableError(
+                    f"C++ controller circuit open, failing fast for {method} {path}"
                 )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("success", False)
-                return False
-            
+            # Half-open: allow one probe through to test recovery
+            self._breaker_opened_at = None
+
+        last_error: Optional[Exception] = None
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                response = await self._client.request(method, path, content=content, timeout=timeout)
+                self._breaker_failures = 0
+                return response
+            except self._RETRYABLE_ERRORS as e:
+                last_error = e
+                self._breaker_failures += 1
+                if self._breaker_failures >= self.BREAKER_FAIL_MAX:
+                    self._breaker_opened_at = time.monotonic()
+                    break
+                if attempt < self.RETRY_ATTEMPTS - 1:
+                    # 50ms base doubling per attempt, capped at 1s, with jitter
+                    backoff = min(1.0, 0.05 * (2 ** attempt))
+                    await asyncio.sleep(backoff * (0.5 + random.random()))
+
+        raise last_error
+
+    async def _call(self, method: str, path: str, payload: Any = None,
+                    timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Issue one RPC and decode its JSON body, or None on any failure.
+
+        Centralizes the encode/status-check/decode/error-log skeleton that
+        was previously duplicated across every public method.
+        """
+
+        try:
+            response = await self._request(
+                method, path,
+                content=orjson.dumps(payload) if payload is not None else None,
+                timeout=timeout
+            )
+            if response.status_code == 200:
+                body = response.content
+                if response.headers.get("content-encoding") == "zstd":
+                    body = _ZSTD_DECOMPRESSOR.decompress(body)
+                return orjson.loads(body)
+            return None
         except Exception as e:
-            logger.error(f"Failed to create mount point: {e}")
-            return False
-    
+            logger.error(f"{method} {path} failed: {e}")
+            return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def create_mount_point(self, stream_config: Dict[str, Any]) -> bool:
+        """Create mount point on Icecast server via C++ service"""
+        cpp_config = self._convert_to_cpp_config(stream_config)
+        result = await self._call("POST", "/api/v1/streams", payload=cpp_config)
+        return bool(result) and result.get("success", False)
+
     async def activate_stream(self, stream_id: str) -> bool:
         """Activate stream on C++ service"""
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/streams/{stream_id}/activate"
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("success", False)
-                return False
-            
-        except Exception as e:
-            logger.error(f"Failed to activate stream {stream_id}: {e}")
-            return False
-    
+        result = await self._call("POST", _STREAM_PATHS["activate"] % stream_id)
+        success = bool(result) and result.get("success", False)
+        if success:
+            # Cached status is stale once the stream changes state
+            self._status_cache.pop(stream_id, None)
+        return success
+
     async def deactivate_stream(self, stream_id: str) -> bool:
         """Deactivate stream on C++ service"""
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/streams/{stream_id}/deactivate"
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("success", False)
-                return False
-            
-        except Exception as e:
-            logger.error(f"Failed to deactivate stream {stream_id}: {e}")
-            return False
-    
+        result = await self._call("POST", _STREAM_PATHS["deactivate"] % stream_id)
+        success = bool(result) and result.get("success", False)
+        if success:
+            self._status_cache.pop(stream_id, None)
+        return success
+
+    async def create_mount_points_batch(self, stream_configs: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """Create multiple mount points in a single RPC to the C++ service"""
+
+        if not stream_configs:
+            return {}
+
+        items = [self._convert_to_cpp_config(config) for config in stream_configs]
+        result = await self._call("POST", "/api/v1/streams:batch", payload={"items": items})
+        if result is not None:
+            return {str(k): bool(v) for k, v in result.get("results", {}).items()}
+        return {item["stream_id"]: False for item in items}
+
+    async def activate_streams_batch(self, stream_ids: List[str]) -> Dict[str, bool]:
+        """Activate multiple streams in a single RPC to the C++ service"""
+        return await self._batch_verb("activate", stream_ids)
+
+    async def deactivate_streams_batch(self, stream_ids: List[str]) -> Dict[str, bool]:
+        """Deactivate multiple streams in a single RPC to the C++ service"""
+        return await self._batch_verb("deactivate", stream_ids)
+
+    async def delete_mount_points_batch(self, stream_ids: List[str]) -> Dict[str, bool]:
+        """Delete multiple mount points in a single RPC to the C++ service"""
+        return await self._batch_verb("delete", stream_ids)
+
+    async def _batch_verb(self, verb: str, stream_ids: List[str]) -> Dict[str, bool]:
+        """POST one JSON array of stream IDs for a bulk verb, return per-id results.
+
+        Coalescing N per-stream RPCs into one request amortizes the network
+        round-trip and JSON parsing when bulk provisioning or shutting down.
+        """
+
+        if not stream_ids:
+            return {}
+
+        result = await self._call("POST", _STREAM_PATHS["batch_verb"] % verb, payload={"items": stream_ids})
+        if result is not None:
+            return {str(k): bool(v) for k, v in result.get("results", {}).items()}
+        return {stream_id: False for stream_id in stream_ids}
+
     async def update_stream_config(self, stream_id: str, config: Dict[str, Any]) -> bool:
         """Update stream configuration on C++ service"""
-        
-        try:
-            cpp_config = self._convert_to_cpp_config(config)
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.put(
-                    f"{self.base_url}/api/v1/streams/{stream_id}",
-                    json=cpp_config
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("success", False)
-                return False
-            
-        except Exception as e:
-            logger.error(f"Failed to update stream config {stream_id}: {e}")
-            return False
-    
+        cpp_config = self._convert_to_cpp_config(config)
+        result = await self._call("PUT", _STREAM_PATHS["detail"] % stream_id, payload=cpp_config)
+        return bool(result) and result.get("success", False)
+
     async def get_stream_status(self, stream_id: str) -> Optional[Dict[str, Any]]:
-        """Get live stream status from C++ service"""
-        
+        """Get live stream status from C++ service (cached for 1s per stream)"""
+
+        cached = self._status_cache.get(stream_id)
+        if cached is not None:
+            return cached
+
+        # Collapse concurrent polls for the same stream into one upstream call
+        inflight = self._status_inflight.get(stream_id)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._status_inflight[stream_id] = future
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/streams/{stream_id}/status"
-                )
-                
-                if response.status_code == 200:
-                    cpp_status = response.json()
-                    return self._convert_from_cpp_status(cpp_status)
-                return None
-            
-        except Exception as e:
-            logger.error(f"Failed to get stream status {stream_id}: {e}")
-            return None
-    
-    async def delete_mount_point(self, stream_id: str) -> bool:
-        """Delete mount point from C++ service"""
-        
+            status = await self._fetch_stream_status(stream_id)
+            if status is not None:
+                self._status_cache[stream_id] = status
+            future.set_result(status)
+            return status
+        except BaseException as e:
+            # Propagate failures to the waiters too - they are shielded from
+            # our cancellation, so an unresolved future would hang them
+            if not future.done():
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Mark retrieved so a waiter-less failure doesn't log
+                    # "exception was never retrieved" at GC time
+                    future.exception()
+            raise
+        finally:
+            # Belt and braces: the future must never leave here pending
+            if not future.done():
+                future.cancel()
+            self._status_inflight.pop(stream_id, None)
+
+    async def get_many_status(self, stream_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get live status for many streams concurrently.
+
+        The polls fan out via asyncio.gather over the pooled HTTP/2 client,
+        so N streams resolve in roughly one round-trip instead of N.
+        """
+
+        if not stream_ids:
+            return {}
+
+        results = await asyncio.gather(
+            *(self._call("GET", _STREAM_PATHS["status"] % stream_id) for stream_id in stream_ids)
+        )
+
+        return {
+            stream_id: self._convert_from_cpp_status(result)
+            for stream_id, result in zip(stream_ids, results)
+            if result is not None
+        }
+
+    async def _call_streaming(self, path: str, item_prefix: str, reducer) -> bool:
+        """Stream a large GET response and reduce its items incrementally.
+
+        Instead of buffering a multi-MB analytics payload plus its full
+        parsed object tree, the body is parsed out of response.aiter_bytes()
+        chunk by chunk and reducer(item) is invoked per element, keeping peak
+        memory at O(chunk) rather than O(payload).
+        """
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.delete(
-                    f"{self.base_url}/api/v1/streams/{stream_id}"
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("success", False)
-                return False
-            
+            async with self._client.stream("GET", path) as response:
+                if response.status_code != 200:
+                    return False
+                byte_iterator = response.aiter_bytes()
+                if response.headers.get("content-encoding") == "zstd":
+                    byte_iterator = _zstd_aiter(byte_iterator)
+                reader = _AsyncByteReader(byte_iterator)
+                async for item in ijson.items(reader, item_prefix):
+                    reducer(item)
+                return True
         except Exception as e:
-            logger.error(f"Failed to delete mount point {stream_id}: {e}")
+            logger.error(f"Streaming GET {path} failed: {e}")
             return False
-    
+
+    async def get_stream_history_summary(self, stream_id: str) -> Optional[Dict[str, Any]]:
+        """Aggregate a stream's history records without buffering the payload"""
+
+        totals = {"records": 0, "listeners": 0, "bytes_sent": 0}
+
+        def _accumulate(record):
+            totals["records"] += 1
+            totals["listeners"] += record.get("current_listeners", 0)
+            totals["bytes_sent"] += record.get("bytes_sent", 0)
+
+        ok = await self._call_streaming(
+            _STREAM_PATHS["history"] % stream_id, "records.item", _accumulate
+        )
+        return totals if ok else None
+
+    async def _fetch_stream_status(self, stream_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch live stream status from the C++ service (uncached)"""
+        cpp_status = await self._call("GET", _STREAM_PATHS["status"] % stream_id)
+        return self._convert_from_cpp_status(cpp_status) if cpp_status is not None else None
+
+    async def delete_mount_point(self, stream_id: str) -> bool:
+        """Delete mount point from C++ service"""
+        result = await self._call("DELETE", _STREAM_PATHS["detail"] % stream_id)
+        return bool(result) and result.get("success", False)
+
     async def reload_server_config(self) -> bool:
         """Trigger Icecast server configuration reload"""
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/reload"
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("success", False)
-                return False
-            
-        except Exception as e:
-            logger.error(f"Failed to reload server config: {e}")
-            return False
-    
+        result = await self._call("POST", "/api/v1/reload")
+        return bool(result) and result.get("success", False)
+
     async def health_check(self) -> bool:
-        """Check if C++ Stream Controller is healthy"""
-        
+        """Check if C++ Stream Controller is healthy (cached for 1s)"""
+
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/health")
-                
-                if response.status_code == 200:
-                    health_data = response.json()
-                    return health_data.get("healthy", False)
-                return False
-            
-        except Exception as e:
-            logger.error(f"C++ service health check failed: {e}")
-            return False
+            return self._health_cache["healthy"]
+        except KeyError:
+            pass
+
+        health_data = await self._call("GET", "/health", timeout=5.0)
+        healthy = bool(health_data) and health_data.get("healthy", False)
+
+        self._health_cache["healthy"] = healthy
+        return healthy
     
     def _convert_to_cpp_config(self, fastapi_config: Dict[str, Any]) -> Dict[str, Any]:
         """Convert FastAPI stream config to C++ service format"""
+        get = fastapi_config.get
         return {
-            "stream_id": fastapi_config.get("stream_id", ""),
-            "user_id": fastapi_config.get("user_id", ""),
-            "mount_point": fastapi_config.get("mount_point", ""),
-            "source_password": fastapi_config.get("source_password", ""),
-            "station_name": fastapi_config.get("station_name", ""),
-            "description": fastapi_config.get("description", ""),
-            "genre": fastapi_config.get("genre", "Various"),
-            "quality": int(fastapi_config.get("bitrate", 128)),
-            "max_listeners": int(fastapi_config.get("max_listeners", 100)),
-            "server_host": fastapi_config.get("server_host", "localhost"),
-            "server_port": int(fastapi_config.get("server_port", 8000)),
-            "protocol": fastapi_config.get("protocol", "icecast"),
-            "format": fastapi_config.get("format", "MP3"),
-            "public_stream": fastapi_config.get("public_stream", True)
+            cpp_key: (convert(get(src_key, default)) if convert else get(src_key, default))
+            for cpp_key, src_key, convert, default in _CPP_FIELD_SPEC
         }
     
     def _convert_from_cpp_status(self, cpp_status: Dict[str, Any]) -> Dict[str, Any]:
         """Convert C++ service status to FastAPI format"""
-        # Map C++ status codes to FastAPI status names
-        status_map = {
-            0: "PENDING",
-            1: "READY", 
-            2: "ACTIVE",
-            3: "INACTIVE",
-            4: "ERROR",
-            5: "SUSPENDED",
-            6: "DELETED"
-        }
-        
         status_code = cpp_status.get("status", 4)
-        
+
         return {
             "stream_id": cpp_status.get("stream_id", ""),
-            "status": status_map.get(status_code, "ERROR"),
+            "status": _STATUS_NAMES[status_code] if 0 <= status_code < len(_STATUS_NAMES) else "ERROR",
             "is_connected": cpp_status.get("is_connected", False),
             "current_listeners": cpp_status.get("current_listeners", 0),
             "peak_listeners": cpp_status.get("peak_listeners", 0),
@@ -269,7 +549,28 @@ class CppControllerService:
     
     async def close(self):
         """Close HTTP client"""
-        await self.client.aclose()
+        await self._client.aclose()
+
+
+# Singleton instance shared across requests so the connection pool is reused.
+# Created lazily at first use; closed from the FastAPI shutdown event.
+_cpp_controller_service: Optional[CppControllerService] = None
+
+
+def get_cpp_controller_service() -> CppControllerService:
+    """Get shared CppControllerService instance"""
+    global _cpp_controller_service
+    if _cpp_controller_service is None:
+        _cpp_controller_service = CppControllerService()
+    return _cpp_controller_service
+
+
+async def close_cpp_controller_service():
+    """Close the shared CppControllerService (called on app shutdown)"""
+    global _cpp_controller_service
+    if _cpp_controller_service is not None:
+        await _cpp_controller_service.close()
+        _cpp_controller_service = None
 
 
 class NotificationService:
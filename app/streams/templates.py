@@ -3,7 +3,11 @@ Default Stream Templates
 Predefined configurations for common streaming scenarios
 """
 
+import orjson
+
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from ..stream_models import StreamTemplate, StreamQuality
 
 # Default stream templates to be inserted into database
@@ -232,6 +236,43 @@ DEFAULT_TEMPLATES = [
     }
 ]
 
+# Name -> template index, built once at import so lookups are O(1)
+_TEMPLATES_BY_NAME = {template["name"]: template for template in DEFAULT_TEMPLATES}
+
+# Pre-serialized config_template payloads. The templates are a fixed set, so
+# encoding them once at import avoids re-running JSON serialization every
+# time a template config is pushed to the C++ controller.
+_TEMPLATE_CONFIG_JSON = {
+    template["name"]: orjson.dumps(template["config_template"])
+    for template in DEFAULT_TEMPLATES
+}
+
+
+def get_template_config_json(template_name: str) -> bytes:
+    """Get the pre-serialized JSON bytes for a template's config_template.
+
+    Send these directly as a request body (content=...) instead of
+    re-encoding the dict per call. Treat the returned bytes as immutable.
+    """
+    return _TEMPLATE_CONFIG_JSON[template_name]
+
+
+# Use case aliases -> template names (module constant so it isn't rebuilt per call)
+_USE_CASE_MAPPING = {
+    "talk": "talk_radio",
+    "podcast": "talk_radio",
+    "music": "standard_music",
+    "dj": "dj_mix_session",
+    "live": "live_event",
+    "event": "live_event",
+    "mobile": "mobile_optimized",
+    "hq": "hq_music",
+    "high_quality": "hq_music",
+    "premium": "premium_audiophile",
+    "automated": "24_7_automation",
+    "radio": "24_7_automation"
+}
+
 # Reserved system mount points
 SYSTEM_RESERVED_MOUNTS = [
     "/admin",
@@ -261,32 +302,36 @@ def create_default_templates(db_session):
     """
     
     from ..stream_models import StreamTemplate, MountPoint
-    
-    # Create templates
-    for template_data in DEFAULT_TEMPLATES:
-        existing = db_session.query(StreamTemplate).filter(
-            StreamTemplate.name == template_data["name"]
-        ).first()
-        
-        if not existing:
-            template = StreamTemplate(**template_data)
-            db_session.add(template)
-    
-    # Reserve system mount points
-    for mount in SYSTEM_RESERVED_MOUNTS:
-        existing = db_session.query(MountPoint).filter(
-            MountPoint.mount_point == mount
-        ).first()
-        
-        if not existing:
-            mount_point = MountPoint(
-                mount_point=mount,
-                status="system_reserved",
-                is_system_reserved=True,
-                notes="System reserved mount point"
-            )
-            db_session.add(mount_point)
-    
+
+    # Create templates: one SELECT for existing names, one bulk insert for
+    # the rest instead of a query + add per template
+    existing_names = {
+        row[0] for row in db_session.query(StreamTemplate.name).filter(
+            StreamTemplate.name.in_([t["name"] for t in DEFAULT_TEMPLATES])
+        ).all()
+    }
+    missing_templates = [t for t in DEFAULT_TEMPLATES if t["name"] not in existing_names]
+    if missing_templates:
+        db_session.bulk_insert_mappings(StreamTemplate, missing_templates)
+
+    # Reserve system mount points the same way
+    existing_mounts = {
+        row[0] for row in db_session.query(MountPoint.mount_point).filter(
+            MountPoint.mount_point.in_(SYSTEM_RESERVED_MOUNTS)
+        ).all()
+    }
+    missing_mounts = [
+        {
+            "mount_point": mount,
+            "status": "system_reserved",
+            "is_system_reserved": True,
+            "notes": "System reserved mount point"
+        }
+        for mount in SYSTEM_RESERVED_MOUNTS if mount not in existing_mounts
+    ]
+    if missing_mounts:
+        db_session.bulk_insert_mappings(MountPoint, missing_mounts)
+
     try:
         db_session.commit()
         print("✅ Default stream templates and system mounts created successfully")
@@ -295,37 +340,28 @@ def create_default_templates(db_session):
         print(f"❌ Error creating default templates: {e}")
 
 
-def get_template_by_use_case(use_case: str) -> dict:
+@lru_cache(maxsize=32)
+def _lookup_template_by_use_case(use_case_lc: str) -> MappingProxyType:
+    """Cached lookup for a lowercased use case (32 slots cover every alias)"""
+
+    template_name = _USE_CASE_MAPPING.get(use_case_lc, "standard_music")
+
+    # Fall back to standard music if the mapping points at an unknown template
+    return MappingProxyType(
+        _TEMPLATES_BY_NAME.get(template_name, _TEMPLATES_BY_NAME["standard_music"])
+    )
+
+
+def get_template_by_use_case(use_case: str) -> MappingProxyType:
     """
     Get recommended template based on use case.
-    
+
     Args:
         use_case: Type of streaming use case
-        
+
     Returns:
-        Template configuration dictionary
+        Read-only view of the template configuration. The result is cached
+        and shared, so callers that need to modify it must copy with dict().
     """
-    
-    use_case_mapping = {
-        "talk": "talk_radio",
-        "podcast": "talk_radio", 
-        "music": "standard_music",
-        "dj": "dj_mix_session",
-        "live": "live_event",
-        "event": "live_event",
-        "mobile": "mobile_optimized",
-        "hq": "hq_music",
-        "high_quality": "hq_music",
-        "premium": "premium_audiophile",
-        "automated": "24_7_automation",
-        "radio": "24_7_automation"
-    }
-    
-    template_name = use_case_mapping.get(use_case.lower(), "standard_music")
-    
-    for template in DEFAULT_TEMPLATES:
-        if template["name"] == template_name:
-            return template
-    
-    # Return standard music as fallback
-    return DEFAULT_TEMPLATES[1]  # standard_music template
\ No newline at end of file
+
+    return _lookup_template_by_use_case(use_case.lower())
\ No newline at end of file
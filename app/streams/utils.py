@@ -6,11 +6,87 @@ Helper functions for mount point generation, validation, etc.
 import re
 import secrets
 import string
+import numpy as np
+from datetime import datetime
 from typing import Optional, List, Dict
+from urllib.parse import urlsplit
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
 from ..stream_models import MountPoint, UserStream
 from .schemas import StreamCreate, StreamConfigValidation
+from .services import StreamService
+
+# Shared CSPRNG: draws OS entropy in bulk rather than per character
+_SYSTEM_RNG = secrets.SystemRandom()
+
+# Short-lived availability results: absorbs the admin UI firing a check
+# per keystroke without hitting the DB each time
+_AVAILABILITY_CACHE: TTLCache = TTLCache(maxsize=512, ttl=30)
+
+# Precompiled patterns for the stream-creation hot path
+_MOUNT_INVALID_RE = re.compile(r'[^a-z0-9\s_-]')  # dash last so it's a literal, not a range
+_WHITESPACE_RE = re.compile(r'\s+')
+_SEP_COLLAPSE_RE = re.compile(r'[-_]+')
+_DOUBLE_SLASH_RE = re.compile(r'/+')
+
+
+class _DeleteUnlessAllowed(dict):
+    """str.translate table: allowed chars map to themselves, the rest are deleted"""
+
+    def __missing__(self, code):
+        return None
+
+
+# Single-pass C-level filter for mount-point characters (faster than re.sub)
+_MOUNT_SANITIZE_TABLE = _DeleteUnlessAllowed(
+    {ord(c): c for c in string.ascii_letters + string.digits + '/_-'}
+)
+
+_MAX_URL_LENGTH = 2048
+
+
+def _valid_url(url: str) -> bool:
+    """Cheap scheme/netloc check via urlsplit (no regex backtracking)"""
+    if len(url) > _MAX_URL_LENGTH:
+        return False
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme in ('http', 'https') and bool(parts.netloc)
+
+
+# Validation constants (module scope so they aren't rebuilt per call)
+# Plain alternation (no word anchors): the baseline check was substring
+# containment, so "testing" or "superadmin" must still warn
+_RESERVED_RE = re.compile(r'admin|api|system|server|test|www|ftp|mail', re.IGNORECASE)
+_VALID_GENRES = frozenset({
+    'rock', 'pop', 'jazz', 'classical', 'electronic', 'hip-hop', 'country',
+    'folk', 'blues', 'reggae', 'funk', 'soul', 'punk', 'metal', 'indie',
+    'alternative', 'dance', 'house', 'techno', 'ambient', 'world',
+    'latin', 'gospel', 'r&b', 'ska', 'dub', 'experimental', 'talk',
+    'news', 'sports', 'comedy', 'variety'
+})
+_VALID_BITRATES = frozenset({32, 48, 64, 96, 128, 160, 192, 224, 256, 320})
+_SUPPORTED_FORMATS = frozenset({'mp3', 'aac', 'ogg'})
+
+# Static part of every Icecast mount config; flat string values only, so
+# the PEP 584 merge in generate_icecast_config never aliases mutable state
+# between calls (nested dicts are built fresh per call)
+_ICECAST_DEFAULTS = {
+    "charset": "UTF-8",
+    "burst-on-connect": "1",
+    "burst-size": "65536"
+}
+
+# (divisor, format) per 1024-power bucket for format_bandwidth_usage
+_BANDWIDTH_UNITS = (
+    (1, '{:d} B'),
+    (1024, '{:.1f} KB'),
+    (1024 ** 2, '{:.1f} MB'),
+    (1024 ** 3, '{:.2f} GB')
+)
 
 
 def generate_mount_point(stream_name: str, db: Session, max_attempts: int = 10) -> Optional[str]:
@@ -28,9 +104,9 @@ def generate_mount_point(stream_name: str, db: Session, max_attempts: int = 10)
     
     # Clean stream name for mount point
     base_name = stream_name.lower()
-    base_name = re.sub(r'[^a-z0-9\s-_]', '', base_name)  # Remove special chars
-    base_name = re.sub(r'\s+', '_', base_name.strip())   # Replace spaces with underscores
-    base_name = re.sub(r'[-_]+', '_', base_name)         # Collapse multiple separators
+    base_name = _MOUNT_INVALID_RE.sub('', base_name)          # Remove special chars
+    base_name = _WHITESPACE_RE.sub('_', base_name.strip())    # Replace spaces with underscores
+    base_name = _SEP_COLLAPSE_RE.sub('_', base_name)          # Collapse multiple separators
     
     # Ensure it starts with letter or underscore
     if base_name and not base_name[0].isalpha() and base_name[0] != '_':
@@ -44,35 +120,34 @@ def generate_mount_point(stream_name: str, db: Session, max_attempts: int = 10)
     if len(base_name) > 20:
         base_name = base_name[:20]
     
-    # Try to find unique mount point
-    for attempt in range(max_attempts):
-        if attempt == 0:
-            # First try with clean name
-            mount_point = f"/{base_name}"
-        else:
-            # Add number suffix for subsequent attempts
-            mount_point = f"/{base_name}_{attempt}"
-        
-        # Check if mount point is available
-        existing = db.query(MountPoint).filter(
-            MountPoint.mount_point == mount_point
-        ).first()
-        
-        if not existing:
+    # Probe all candidates in one IN query instead of one round-trip each:
+    # clean name first, then numbered suffixes
+    candidates = [f"/{base_name}"] + [
+        f"/{base_name}_{attempt}" for attempt in range(1, max_attempts)
+    ]
+    taken = {
+        row[0] for row in db.query(MountPoint.mount_point).filter(
+            MountPoint.mount_point.in_(candidates)
+        ).all()
+    }
+    for mount_point in candidates:
+        if mount_point not in taken:
             return mount_point
-    
-    # If all attempts failed, generate random suffix
-    for _ in range(5):
-        random_suffix = ''.join(secrets.choice(string.digits) for _ in range(4))
-        mount_point = f"/{base_name}_{random_suffix}"
-        
-        existing = db.query(MountPoint).filter(
-            MountPoint.mount_point == mount_point
-        ).first()
-        
-        if not existing:
+
+    # If all attempts failed, try random suffixes (also batched in one query)
+    random_candidates = [
+        f"/{base_name}_{''.join(secrets.choice(string.digits) for _ in range(4))}"
+        for _ in range(5)
+    ]
+    taken = {
+        row[0] for row in db.query(MountPoint.mount_point).filter(
+            MountPoint.mount_point.in_(random_candidates)
+        ).all()
+    }
+    for mount_point in random_candidates:
+        if mount_point not in taken:
             return mount_point
-    
+
     return None
 
 
@@ -90,19 +165,20 @@ def generate_source_password(length: int = 16) -> str:
     if length < 12:
         length = 12
     
-    # Use a mix of letters, numbers, and safe special characters
+    # Use a mix of letters, numbers, and safe special characters.
+    # SystemRandom.choices draws entropy in bulk instead of one
+    # os.urandom read per character. Seeding one char from each required
+    # class up front guarantees coverage without rescanning the result.
     alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-    password = ''.join(secrets.choice(alphabet) for _ in range(length))
-    
-    # Ensure password has at least one of each character type
-    if not any(c.islower() for c in password):
-        password = password[:-1] + secrets.choice(string.ascii_lowercase)
-    if not any(c.isupper() for c in password):
-        password = password[:-1] + secrets.choice(string.ascii_uppercase)
-    if not any(c.isdigit() for c in password):
-        password = password[:-1] + secrets.choice(string.digits)
-    
-    return password
+    chars = [
+        _SYSTEM_RNG.choice(string.ascii_lowercase),
+        _SYSTEM_RNG.choice(string.ascii_uppercase),
+        _SYSTEM_RNG.choice(string.digits)
+    ]
+    chars += _SYSTEM_RNG.choices(alphabet, k=length - len(chars))
+    _SYSTEM_RNG.shuffle(chars)
+
+    return ''.join(chars)
 
 
 def validate_stream_config(stream_data: StreamCreate) -> StreamConfigValidation:
@@ -126,9 +202,8 @@ def validate_stream_config(stream_data: StreamCreate) -> StreamConfigValidation:
     if len(stream_data.stream_name) > 100:
         errors.append("Stream name cannot exceed 100 characters")
     
-    # Check for reserved words in stream name
-    reserved_words = ['admin', 'api', 'system', 'server', 'test', 'www', 'ftp', 'mail']
-    if any(word in stream_data.stream_name.lower() for word in reserved_words):
+    # Check for reserved words in stream name (single alternation scan)
+    if _RESERVED_RE.search(stream_data.stream_name):
         warnings.append("Stream name contains reserved word that may cause conflicts")
     
     # Server name validation
@@ -137,9 +212,8 @@ def validate_stream_config(stream_data: StreamCreate) -> StreamConfigValidation:
     
     # Bitrate validation
     if stream_data.bitrate:
-        valid_bitrates = [32, 48, 64, 96, 128, 160, 192, 224, 256, 320]
-        if stream_data.bitrate not in valid_bitrates:
-            errors.append(f"Bitrate must be one of: {valid_bitrates}")
+        if stream_data.bitrate not in _VALID_BITRATES:
+            errors.append(f"Bitrate must be one of: {sorted(_VALID_BITRATES)}")
         
         if stream_data.bitrate > 192:
             warnings.append("High bitrate streams (>192kbps) consume more bandwidth and may cost extra")
@@ -154,35 +228,18 @@ def validate_stream_config(stream_data: StreamCreate) -> StreamConfigValidation:
     
     # URL validation
     if stream_data.server_url:
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        if not url_pattern.match(stream_data.server_url):
+        if not _valid_url(stream_data.server_url):
             errors.append("Invalid server URL format")
     
     # Genre validation
     if stream_data.genre:
-        valid_genres = [
-            'rock', 'pop', 'jazz', 'classical', 'electronic', 'hip-hop', 'country',
-            'folk', 'blues', 'reggae', 'funk', 'soul', 'punk', 'metal', 'indie',
-            'alternative', 'dance', 'house', 'techno', 'ambient', 'world',
-            'latin', 'gospel', 'r&b', 'ska', 'dub', 'experimental', 'talk',
-            'news', 'sports', 'comedy', 'variety'
-        ]
-        
-        if stream_data.genre.lower() not in valid_genres:
+        if stream_data.genre.lower() not in _VALID_GENRES:
             warnings.append(f"Genre '{stream_data.genre}' is not in the standard list. This may affect discoverability.")
     
     # Format validation
     if stream_data.format:
-        supported_formats = ['mp3', 'aac', 'ogg']
-        if stream_data.format.lower() not in supported_formats:
-            errors.append(f"Audio format must be one of: {supported_formats}")
+        if stream_data.format.lower() not in _SUPPORTED_FORMATS:
+            errors.append(f"Audio format must be one of: {sorted(_SUPPORTED_FORMATS)}")
     
     # Icecast config validation
     if stream_data.icecast_config:
@@ -201,7 +258,6 @@ def validate_stream_config(stream_data: StreamCreate) -> StreamConfigValidation:
     estimated_bandwidth = None
     
     if stream_data.bitrate and stream_data.max_listeners:
-        from .services import StreamService
         cost_info = StreamService.calculate_estimated_costs(
             stream_data.bitrate, 
             stream_data.max_listeners
@@ -240,11 +296,11 @@ def sanitize_mount_point(mount_point: str) -> str:
     if not mount_point.startswith('/'):
         mount_point = f"/{mount_point}"
     
-    # Remove invalid characters
-    mount_point = re.sub(r'[^a-zA-Z0-9/_-]', '', mount_point)
-    
+    # Remove invalid characters in one translate pass
+    mount_point = mount_point.translate(_MOUNT_SANITIZE_TABLE)
+
     # Remove double slashes
-    mount_point = re.sub(r'/+', '/', mount_point)
+    mount_point = _DOUBLE_SLASH_RE.sub('/', mount_point)
     
     # Limit length
     if len(mount_point) > 50:
@@ -268,35 +324,35 @@ def generate_icecast_config(stream_data: dict) -> dict[str, any]:
         Icecast configuration dictionary
     """
     
-    config = {
+    server_description = stream_data.get("server_description", "")
+
+    # Merge the static skeleton with the per-stream values (PEP 584) so the
+    # constant keys aren't rebuilt on every call
+    config = _ICECAST_DEFAULTS | {
+        # Fresh dict per call: callers inject credentials into it, and a
+        # shared module-level nested dict would leak across streams
+        "authentication": {
+            "type": "source"
+        },
         "mount-name": stream_data["mount_point"],
         "password": stream_data["source_password"],
         "bitrate": stream_data["bitrate"],
         "max-listeners": stream_data["max_listeners"],
         "public": "1" if stream_data.get("public", True) else "0",
-        
+
         # Metadata
         "server-name": stream_data["server_name"],
-        "server-description": stream_data.get("server_description", ""),
+        "server-description": server_description,
         "genre": stream_data.get("genre", "Various"),
         "server-url": stream_data.get("server_url", ""),
-        
+
         # Technical settings
-        "charset": "UTF-8",
         "stream-name": stream_data["stream_name"],
-        "stream-description": stream_data.get("server_description", ""),
-        
-        # Default settings for reliability
-        "burst-on-connect": "1",
-        "burst-size": "65536",
+        "stream-description": server_description,
+
         "queue-size": str(stream_data["bitrate"] * 1024 * 2),  # 2 seconds of audio
-        
-        # Authentication
-        "authentication": {
-            "type": "source"
-        }
     }
-    
+
     # Add custom configuration if provided
     if "icecast_config" in stream_data and stream_data["icecast_config"]:
         config.update(stream_data["icecast_config"])
@@ -323,13 +379,57 @@ def validate_mount_point_availability(mount_point: str, db: Session, exclude_str
         True if available, False if taken
     """
     
+    cache_key = (mount_point, exclude_stream_id)
+    cached = _AVAILABILITY_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     query = db.query(MountPoint).filter(MountPoint.mount_point == mount_point)
-    
+
+    if exclude_stream_id:
+        query = query.filter(MountPoint.stream_id != exclude_stream_id)
+
+    available = query.first() is None
+    _AVAILABILITY_CACHE[cache_key] = available
+    return available
+
+
+def invalidate_mount_point_availability(mount_point: str):
+    """Drop cached availability results for a mount point after it is reserved"""
+
+    for key in [k for k in _AVAILABILITY_CACHE if k[0] == mount_point]:
+        _AVAILABILITY_CACHE.pop(key, None)
+
+
+def validate_mount_points_availability(
+    mount_points: List[str],
+    db: Session,
+    exclude_stream_id: Optional[str] = None
+) -> Dict[str, bool]:
+    """
+    Check availability for several mount points with a single query.
+
+    Args:
+        mount_points: Mount points to check
+        db: Database session
+        exclude_stream_id: Stream ID to exclude from check (for updates)
+
+    Returns:
+        Mapping of mount point -> True if available, False if taken
+    """
+
+    if not mount_points:
+        return {}
+
+    query = db.query(MountPoint.mount_point).filter(
+        MountPoint.mount_point.in_(mount_points)
+    )
+
     if exclude_stream_id:
         query = query.filter(MountPoint.stream_id != exclude_stream_id)
-    
-    existing = query.first()
-    return existing is None
+
+    taken = {row[0] for row in query.all()}
+    return {mount_point: mount_point not in taken for mount_point in mount_points}
 
 
 def get_recommended_bitrates() -> list[dict[str, any]]:
@@ -383,14 +483,10 @@ def format_bandwidth_usage(bytes_count: int) -> str:
         Formatted string (e.g., "1.5 GB", "250 MB")
     """
     
-    if bytes_count < 1024:
-        return f"{bytes_count} B"
-    elif bytes_count < 1024 ** 2:
-        return f"{bytes_count / 1024:.1f} KB"
-    elif bytes_count < 1024 ** 3:
-        return f"{bytes_count / (1024 ** 2):.1f} MB"
-    else:
-        return f"{bytes_count / (1024 ** 3):.2f} GB"
+    # Branchless unit selection: bit_length // 10 picks the 1024-power bucket
+    index = min(max((bytes_count.bit_length() - 1) // 10, 0), 3)
+    divisor, fmt = _BANDWIDTH_UNITS[index]
+    return fmt.format(bytes_count if divisor == 1 else bytes_count / divisor)
 
 
 def calculate_stream_uptime(created_at, last_connected_at, current_status) -> dict[str, any]:
@@ -400,9 +496,7 @@ def calculate_stream_uptime(created_at, last_connected_at, current_status) -> di
     Returns:
         Dictionary with uptime information
     """
-    
-    from datetime import datetime
-    
+
     now = datetime.utcnow()
     total_age = (now - created_at).total_seconds()
     
@@ -419,6 +513,47 @@ def calculate_stream_uptime(created_at, last_connected_at, current_status) -> di
         # Assume good uptime for active streams
         uptime_percentage = max(0.0, min(95.0, 90.0 - (last_activity_age / 3600)))
     
+    return {
+        "total_age_hours": total_age / 3600,
+        "uptime_percentage": uptime_percentage,
+        "last_activity_hours_ago": last_activity_age / 3600,
+        "estimated_total_uptime_hours": (total_age * uptime_percentage / 100) / 3600
+    }
+
+
+def calculate_stream_uptimes(created_at, last_connected_at, current_status) -> dict[str, any]:
+    """
+    Vectorized calculate_stream_uptime for dashboard rendering.
+
+    Args:
+        created_at: array-like of datetime64 creation timestamps
+        last_connected_at: array-like of datetime64, NaT where never connected
+        current_status: array-like of status strings
+
+    Returns:
+        Dictionary of NumPy arrays, one entry per stream
+    """
+
+    created = np.asarray(created_at, dtype='datetime64[s]')
+    last_connected = np.asarray(last_connected_at, dtype='datetime64[s]')
+    status = np.asarray(current_status)
+
+    now = np.datetime64(datetime.utcnow(), 's')
+    total_age = (now - created) / np.timedelta64(1, 's')
+    last_activity_age = np.where(
+        ~np.isnat(last_connected),
+        (now - last_connected) / np.timedelta64(1, 's'),
+        total_age
+    )
+
+    # Same heuristic as the scalar version, applied to the whole batch
+    active = np.isin(status, ('active', 'ready'))
+    uptime_percentage = np.where(
+        active,
+        np.clip(90.0 - (last_activity_age / 3600), 0.0, 95.0),
+        0.0
+    )
+
     return {
         "total_age_hours": total_age / 3600,
         "uptime_percentage": uptime_percentage,
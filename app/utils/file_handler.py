@@ -2,15 +2,19 @@
 File handling utilities for uploads
 """
 
+import asyncio
 import os
 import shutil
 from typing import Optional
+import aiofiles
 from fastapi import UploadFile, HTTPException
 from PIL import Image
 import uuid
 
 from ..config import settings
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 
 ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
 ALLOWED_AUDIO_EXTENSIONS = {'.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg'}
@@ -66,14 +70,15 @@ async def save_upload_file(file: UploadFile, subfolder: str = "", file_type: str
     # Create filename and path
     filename = generate_unique_filename(file.filename)
     upload_path = os.path.join(settings.upload_dir, subfolder)
-    os.makedirs(upload_path, exist_ok=True)
+    await asyncio.to_thread(os.makedirs, upload_path, exist_ok=True)
     
     file_path = os.path.join(upload_path, filename)
     
     try:
-        # Save file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save file in chunks without blocking the event loop
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
         
         # Optimize image if it's an image file
         if file_type == "image":
@@ -84,14 +89,14 @@ async def save_upload_file(file: UploadFile, subfolder: str = "", file_type: str
         
     except Exception as e:
         # Clean up file if something went wrong
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        if await asyncio.to_thread(os.path.exists, file_path):
+            await asyncio.to_thread(os.remove, file_path)
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
 
 
-async def optimize_image(file_path: str):
+def _sync_optimize_image(file_path: str):
     """
-    Optimize image size and quality
+    Optimize image size and quality (CPU-bound, runs in a worker thread)
     """
     try:
         with Image.open(file_path) as img:
@@ -100,30 +105,43 @@ async def optimize_image(file_path: str):
                 rgb_img = Image.new('RGB', img.size, (255, 255, 255))
                 rgb_img.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
                 img = rgb_img
-            
+
             # Resize if too large
             if img.size[0] > MAX_IMAGE_SIZE[0] or img.size[1] > MAX_IMAGE_SIZE[1]:
                 img.thumbnail(MAX_IMAGE_SIZE, Image.Resampling.LANCZOS)
-            
-            # Save with optimization
-            img.save(file_path, optimize=True, quality=85)
-            
+
+            # Save with optimization (progressive JPEG / compressed PNG)
+            ext = os.path.splitext(file_path)[1].lower()
+            if ext in ('.jpg', '.jpeg'):
+                img.save(file_path, optimize=True, quality=85, progressive=True, subsampling=2)
+            elif ext == '.png':
+                img.save(file_path, optimize=True, compress_level=6)
+            else:
+                img.save(file_path, optimize=True, quality=85)
+
     except Exception as e:
         # If optimization fails, keep original file
         print(f"Warning: Failed to optimize image {file_path}: {str(e)}")
 
 
-def delete_file(file_path: Optional[str]):
+async def optimize_image(file_path: str):
+    """
+    Optimize image size and quality without blocking the event loop
+    """
+    await asyncio.to_thread(_sync_optimize_image, file_path)
+
+
+async def delete_file(file_path: Optional[str]):
     """
-    Delete file from disk
+    Delete file from disk without blocking the event loop
     """
     if not file_path:
         return
-    
+
     full_path = os.path.join(settings.upload_dir, file_path)
-    if os.path.exists(full_path):
+    if await asyncio.to_thread(os.path.exists, full_path):
         try:
-            os.remove(full_path)
+            await asyncio.to_thread(os.remove, full_path)
         except Exception as e:
             print(f"Warning: Failed to delete file {full_path}: {str(e)}")
 
@@ -9,88 +9,83 @@ import os
 # Add parent directory to path to import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db, engine
-from app.stream_provisioning.models import ShoutcastServer, PortPool
+from app.stream_provisioning.stream_provisioning_models import ShoutcastServer, PortPool
 from datetime import datetime
 
 
+def build_port_pool_rows() -> list:
+    """Build insert rows for the default port pool (8100-8200 inclusive).
+
+    Timestamps are omitted: the Base columns carry server_default=func.now(),
+    so the database assigns them without 202 client-side clock reads.
+    """
+    return [
+        {
+            "port": port,
+            "is_allocated": False
+        }
+        for port in range(8100, 8201)
+    ]
+
+
 async def init_stream_infrastructure():
     """Initialize default Shoutcast server and port pool"""
     
     # Create tables if they don't exist
-    from app.stream_provisioning.models import Base
+    from app.database import Base
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
+
     async with AsyncSession(engine) as db:
         try:
             # Check if default server already exists
             from sqlalchemy import select
-            result = await db.execute(select(ShoutcastServer).where(ShoutcastServer.host == 'localhost'))
-            existing_server = result.scalar_one_or_none()
-            
+            result = await db.execute(select(ShoutcastServer).where(ShoutcastServer.hostname == 'localhost'))
+            existing_server = result.scalars().first()
+
             if not existing_server:
                 # Create default Shoutcast server
                 default_server = ShoutcastServer(
-                    host='localhost',
+                    server_name='Default Shoutcast Server',
+                    hostname='localhost',
                     admin_port=8000,
-                    admin_username='admin',
                     admin_password='changeme123',  # Change this in production!
+                    max_streams=100,
+                    config_file_path='/etc/shoutcast/sc_serv.conf',
+                    executable_path='/usr/local/bin/sc_serv',
                     is_active=True,
-                    max_ports=100,
-                    port_range_start=8100,
-                    port_range_end=8200,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
+                    is_primary=True
                 )
-                
+
                 db.add(default_server)
                 await db.commit()
                 await db.refresh(default_server)
-                
+
                 print(f"✅ Created default Shoutcast server (ID: {default_server.id})")
-                
-                # Create port pool (ports 8100-8200)
-                port_pool_entries = []
-                for port in range(8100, 8201):  # 8100 to 8200 inclusive
-                    port_entry = PortPool(
-                        port_number=port,
-                        server_id=default_server.id,
-                        is_allocated=False,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow()
-                    )
-                    port_pool_entries.append(port_entry)
-                
-                db.add_all(port_pool_entries)
+
+                # Create port pool (ports 8100-8200) in one multi-row INSERT
+                port_pool_rows = build_port_pool_rows()
+                await db.execute(insert(PortPool), port_pool_rows)
                 await db.commit()
-                
-                print(f"✅ Created port pool with {len(port_pool_entries)} ports (8100-8200)")
-                
+
+                print(f"✅ Created port pool with {len(port_pool_rows)} ports (8100-8200)")
+
             else:
                 print(f"ℹ️ Default Shoutcast server already exists (ID: {existing_server.id})")
-                
-                # Check port pool
-                result = await db.execute(select(PortPool).where(PortPool.server_id == existing_server.id))
+
+                # Check port pool (ports are a single global pool keyed by port number)
+                result = await db.execute(select(PortPool.port))
                 existing_ports = result.scalars().all()
-                
+
                 if len(existing_ports) == 0:
-                    # Add missing ports
-                    port_pool_entries = []
-                    for port in range(8100, 8201):
-                        port_entry = PortPool(
-                            port_number=port,
-                            server_id=existing_server.id,
-                            is_allocated=False,
-                            created_at=datetime.utcnow(),
-                            updated_at=datetime.utcnow()
-                        )
-                        port_pool_entries.append(port_entry)
-                    
-                    db.add_all(port_pool_entries)
+                    # Add missing ports in one multi-row INSERT
+                    port_pool_rows = build_port_pool_rows()
+                    await db.execute(insert(PortPool), port_pool_rows)
                     await db.commit()
-                    print(f"✅ Added {len(port_pool_entries)} ports to existing server")
+                    print(f"✅ Added {len(port_pool_rows)} ports to the pool")
                 else:
                     print(f"ℹ️ Port pool already has {len(existing_ports)} ports")
             
@@ -98,7 +93,6 @@ async def init_stream_infrastructure():
             print("📋 Configuration Summary:")
             print(f"   • Shoutcast Server: localhost:8000")
             print(f"   • Port Range: 8100-8200 ({101} ports)")
-            print(f"   • Admin Username: admin")
             print(f"   • Admin Password: changeme123 (CHANGE THIS!)")
             print("\n⚠️  SECURITY NOTE: Change the admin password in production!")
             
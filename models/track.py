@@ -1,9 +1,16 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean
+import numpy as np
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, Index
 from sqlalchemy.sql import func
 from .base import Base
 
 class Track(Base):
     __tablename__ = "tracks"
+    __table_args__ = (
+        # DJ workflows filter by genre plus a BPM range, and browse by
+        # artist/title — composite indexes let both run as index seeks
+        Index('ix_tracks_genre_bpm', 'genre', 'bpm'),
+        Index('ix_tracks_artist_title', 'artist', 'title'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
@@ -57,9 +64,11 @@ class Track(Base):
             'file_format': self.file_format,
             'waveform_path': self.waveform_path,
             'analyzed': self.analyzed,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'last_played': self.last_played.isoformat() if self.last_played else None,
+            # Raw datetimes: orjson serializes them natively in C, so there is
+            # no need to pay for Python-level isoformat() per row
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'last_played': self.last_played,
             'play_count': self.play_count,
             'intro_time': self.intro_time,
             'outro_time': self.outro_time,
@@ -100,5 +109,22 @@ class Track(Base):
             return True
         if abs(self.bpm * 2 - other_bpm) <= tolerance:
             return True
-            
-        return False
\ No newline at end of file
+
+        return False
+
+    @staticmethod
+    def find_compatible_bpms(candidate_bpms, target_bpm, tolerance=5.0):
+        """Vectorized is_compatible_bpm over an array of candidate BPMs.
+
+        Use this for batch mixing suggestions: load BPMs for a candidate set
+        in one query, build an array once, and filter with a boolean mask
+        instead of calling is_compatible_bpm per track.
+        """
+        bpms = np.asarray(candidate_bpms, dtype=np.float64)
+
+        # Direct match plus harmonic (double/half time) compatibility
+        return (
+            (np.abs(bpms - target_bpm) <= tolerance)
+            | (np.abs(bpms - target_bpm * 2) <= tolerance)
+            | (np.abs(bpms * 2 - target_bpm) <= tolerance)
+        )
\ No newline at end of file
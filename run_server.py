@@ -1,16 +0,0 @@
-"""
-FastAPI Server Runner
-Run the application with uvicorn
-"""
-
-import uvicorn
-from app.config import settings
-
-if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host=settings.server_host,
-        port=settings.server_port,
-        reload=settings.debug,
-        log_level="info"
-    )
\ No newline at end of file
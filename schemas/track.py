@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Literal, Optional, List
 from datetime import datetime
 
 class TrackBase(BaseModel):
@@ -63,8 +63,8 @@ class TrackSearchQuery(BaseModel):
     duration_max: Optional[float] = Field(None, description="Maximum duration (seconds)")
     rating_min: Optional[int] = Field(None, ge=1, le=5, description="Minimum rating")
     analyzed_only: Optional[bool] = Field(False, description="Only show analyzed tracks")
-    sort_by: Optional[str] = Field("title", description="Sort field")
-    sort_order: Optional[str] = Field("asc", regex="^(asc|desc)$", description="Sort order")
+    sort_by: Optional[Literal["title", "artist", "album", "genre", "year", "duration", "bpm", "rating", "play_count", "created_at"]] = Field("title", description="Sort field")
+    sort_order: Optional[Literal["asc", "desc"]] = Field("asc", description="Sort order")
     limit: Optional[int] = Field(50, ge=1, le=500, description="Results per page")
     offset: Optional[int] = Field(0, ge=0, description="Results offset")
 
@@ -78,7 +78,7 @@ class TrackSearchResponse(BaseModel):
 class DeckLoadCommand(BaseModel):
     command: str = Field(..., description="WebSocket command type")
     track_id: int = Field(..., ge=1, description="Track ID to load")
-    deck_id: str = Field(..., regex="^(A|B)$", description="Deck identifier (A or B)")
+    deck_id: Literal["A", "B"] = Field(..., description="Deck identifier (A or B)")
     auto_play: Optional[bool] = Field(False, description="Start playing immediately")
     cue_point: Optional[float] = Field(None, ge=0, description="Start position in seconds")
 
@@ -94,4 +94,20 @@ class TrackAnalysisStatus(BaseModel):
     analyzed: bool
     waveform_available: bool
     analysis_progress: Optional[float] = Field(None, ge=0, le=1)
-    error_message: Optional[str] = None
\ No newline at end of file
+    error_message: Optional[str] = None
+
+
+# Compile every core schema at import time so a cold worker pays the
+# pydantic-core build cost before uvicorn accepts its first request
+for _model in (
+    TrackBase, TrackCreate, TrackUpdate, TrackResponse, TrackSearchQuery,
+    TrackSearchResponse, DeckLoadCommand, TrackCompatibility,
+    TrackAnalysisStatus
+):
+    _model.model_rebuild(force=True)
+del _model
+
+# Shared batch validator for lists of tracks. Use
+# TRACK_LIST_ADAPTER.validate_python(rows, from_attributes=True) instead of
+# looping model_validate per row: the iteration stays inside pydantic-core.
+TRACK_LIST_ADAPTER = TypeAdapter(List[TrackResponse])
\ No newline at end of file
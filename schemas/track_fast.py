@@ -0,0 +1,105 @@
+"""
+msgspec mirrors of the track read schemas.
+
+Pydantic stays in charge of input validation (TrackCreate/TrackUpdate need
+its coercion and length constraints), but for the list/search read path a
+msgspec.Struct encodes hundreds of rows per request with near-zero
+per-instance overhead.
+"""
+
+import msgspec
+from datetime import datetime
+from typing import Annotated, List, Literal, Optional
+
+
+class TrackResponseFast(msgspec.Struct):
+    id: int
+    title: str
+    artist: str
+    file_path: str
+    album: Optional[str] = None
+    genre: Optional[str] = None
+    year: Optional[int] = None
+    duration: Optional[float] = None
+    bpm: Optional[float] = None
+    key_signature: Optional[str] = None
+    energy_level: Optional[float] = None
+    file_format: Optional[str] = None
+    intro_time: Optional[float] = None
+    outro_time: Optional[float] = None
+    cue_points: Optional[str] = None
+    rating: Optional[int] = None
+    file_size: Optional[int] = None
+    waveform_path: Optional[str] = None
+    analyzed: bool = False
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    last_played: Optional[datetime] = None
+    play_count: int = 0
+
+
+class TrackSearchResponseFast(msgspec.Struct):
+    tracks: List[TrackResponseFast]
+    total: int
+    limit: int
+    offset: int
+    has_more: bool
+
+
+class DeckLoadCommandFast(msgspec.Struct):
+    """msgspec mirror of DeckLoadCommand for the WebSocket deck-load path.
+
+    Deck loads arrive at real-time frequency, and on malformed frames
+    pydantic-core spends most of its time building full error contexts.
+    Decoding straight from the raw bytes with a precompiled msgspec
+    decoder skips dict construction entirely and rejects bad frames in
+    well under a microsecond.
+    """
+    command: str
+    track_id: Annotated[int, msgspec.Meta(ge=1)]
+    deck_id: Literal["A", "B"]
+    auto_play: bool = False
+    cue_point: Optional[Annotated[float, msgspec.Meta(ge=0)]] = None
+
+
+# Precompiled once at import; msgspec.json.Decoder construction is not free
+DECK_LOAD_DECODER = msgspec.json.Decoder(DeckLoadCommandFast)
+
+
+def decode_deck_load_command(raw: bytes) -> DeckLoadCommandFast:
+    """Decode a raw WebSocket frame into a DeckLoadCommandFast.
+
+    Raises msgspec.ValidationError (or msgspec.DecodeError for invalid
+    JSON) on malformed frames - callers should close or NAK the socket
+    without ever touching Pydantic.
+    """
+    return DECK_LOAD_DECODER.decode(raw)
+
+
+def track_to_fast(track) -> TrackResponseFast:
+    """Build a TrackResponseFast from a Track ORM instance"""
+    return TrackResponseFast(
+        id=track.id,
+        title=track.title,
+        artist=track.artist,
+        file_path=track.file_path,
+        album=track.album,
+        genre=track.genre,
+        year=track.year,
+        duration=track.duration,
+        bpm=track.bpm,
+        key_signature=track.key_signature,
+        energy_level=track.energy_level,
+        file_format=track.file_format,
+        intro_time=track.intro_time,
+        outro_time=track.outro_time,
+        cue_points=track.cue_points,
+        rating=track.rating,
+        file_size=track.file_size,
+        waveform_path=track.waveform_path,
+        analyzed=track.analyzed,
+        created_at=track.created_at,
+        updated_at=track.updated_at,
+        last_played=track.last_played,
+        play_count=track.play_count
+    )
@@ -51,7 +51,7 @@ echo "🚀 FastAPI Backend Setup Complete!"
 echo ""
 echo "To start the server:"
 echo "  source venv/bin/activate"  
-echo "  python run_server.py"
+echo "  python start.py --mode dev"
 echo ""
 echo "Or run directly:"
 echo "  ./start_server.sh"
@@ -18,4 +18,4 @@ echo "📚 API Docs available at http://localhost:8000/api/docs"
 echo "🛑 Press Ctrl+C to stop the server"
 echo ""
 
-python run_server.py
\ No newline at end of file
+python start.py --mode dev
\ No newline at end of file
@@ -5,82 +5,86 @@ Run this after starting the server to verify everything works
 
 import asyncio
 import aiohttp
-import json
+import orjson
 
 API_BASE = "http://localhost:8000"
 
+
+async def fetch_json(session, path, **kwargs):
+    """GET a path and return the decoded JSON body"""
+    async with session.get(path, **kwargs) as resp:
+        return await resp.json(loads=orjson.loads)
+
+
 async def test_api_endpoints():
     """Test basic API functionality"""
-    
-    async with aiohttp.ClientSession() as session:
+
+    # Keep-alive pooling + cached DNS so the sequential calls reuse one
+    # TCP connection instead of reconnecting per request
+    connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60)
+
+    # orjson encodes/decodes the JSON bodies in C instead of the stdlib parser
+    async with aiohttp.ClientSession(
+        base_url=API_BASE,
+        connector=connector,
+        json_serialize=lambda obj: orjson.dumps(obj).decode()
+    ) as session:
         print("🧪 Testing OneStopRadio FastAPI Backend")
         print("=" * 50)
-        
-        # Test health check
-        print("\n1. Testing Health Check...")
+
+        # Health check and root endpoint are independent - overlap them in
+        # one round-trip with gather
+        print("\n1. Testing Health Check + Root Endpoint...")
         try:
-            async with session.get(f"{API_BASE}/api/health/") as resp:
-                data = await resp.json()
-                print(f"✅ Health Check: {data}")
+            health_data, root_data = await asyncio.gather(
+                fetch_json(session, "/api/health/"),
+                fetch_json(session, "/")
+            )
+            print(f"✅ Health Check: {health_data}")
+            print(f"✅ Root: {root_data}")
         except Exception as e:
-            print(f"❌ Health Check Failed: {e}")
+            print(f"❌ Health/Root Check Failed: {e}")
             return
-        
-        # Test root endpoint
-        print("\n2. Testing Root Endpoint...")
-        try:
-            async with session.get(f"{API_BASE}/") as resp:
-                data = await resp.json()
-                print(f"✅ Root: {data}")
-        except Exception as e:
-            print(f"❌ Root Endpoint Failed: {e}")
-        
+
         # Test user registration
-        print("\n3. Testing User Registration...")
+        print("\n2. Testing User Registration...")
         user_data = {
             "username": "testuser",
             "email": "test@example.com",
             "password": "testpassword123",
             "dj_name": "Test DJ"
         }
-        
+
         try:
             async with session.post(
-                f"{API_BASE}/api/v1/auth/register/",
+                "/api/v1/auth/register/",
                 json=user_data
             ) as resp:
                 if resp.status == 201:
-                    data = await resp.json()
+                    data = await resp.json(loads=orjson.loads)
                     print(f"✅ Registration Success: User created")
                     access_token = data.get("tokens", {}).get("access_token")
-                    
-                    if access_token:
-                        print("\n4. Testing Authenticated Endpoints...")
-                        headers = {"Authorization": f"Bearer {access_token}"}
-                        
-                        # Test user profile
-                        async with session.get(
-                            f"{API_BASE}/api/v1/auth/me/",
-                            headers=headers
-                        ) as profile_resp:
-                            profile_data = await profile_resp.json()
-                            print(f"✅ User Profile: {profile_data.get('username')}")
-                        
-                        # Test station creation/retrieval
-                        async with session.get(
-                            f"{API_BASE}/api/v1/stations/",
-                            headers=headers
-                        ) as station_resp:
-                            station_data = await station_resp.json()
-                            print(f"✅ Station Created: {station_data.get('name')}")
-                            
                 else:
-                    error_data = await resp.json()
+                    error_data = await resp.json(loads=orjson.loads)
                     print(f"❌ Registration Failed: {error_data}")
-                    
+                    access_token = None
+
+            if access_token:
+                print("\n3. Testing Authenticated Endpoints...")
+                headers = {"Authorization": f"Bearer {access_token}"}
+
+                # Profile and stations only depend on the token, so they
+                # can run concurrently as well
+                profile_data, station_data = await asyncio.gather(
+                    fetch_json(session, "/api/v1/auth/me/", headers=headers),
+                    fetch_json(session, "/api/v1/stations/", headers=headers)
+                )
+                print(f"✅ User Profile: {profile_data.get('username')}")
+                print(f"✅ Station Created: {station_data.get('name')}")
+
         except Exception as e:
             print(f"❌ Registration Test Failed: {e}")
-        
+
         print("\n" + "=" * 50)
         print("🎯 API Testing Complete!")
         print("\n📚 Full API Documentation: http://localhost:8000/api/docs")
@@ -89,13 +93,13 @@ async def test_api_endpoints():
 if __name__ == "__main__":
     print("Starting API tests...")
     print("Make sure the FastAPI server is running on localhost:8000")
-    print("Run: python run_server.py")
+    print("Run: python start.py --mode dev")
     print()
-    
+
     try:
         asyncio.run(test_api_endpoints())
     except KeyboardInterrupt:
         print("\n🛑 Tests interrupted")
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        print("Make sure the server is running: python run_server.py")
\ No newline at end of file
+        print("Make sure the server is running: python start.py --mode dev")
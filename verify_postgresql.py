@@ -78,7 +78,11 @@ async def test_model_operations():
     
     async with AsyncSessionLocal() as session:
         try:
-            # Test User creation
+            # Rows are grouped by FK dependency so each level flushes in one
+            # round-trip instead of flushing after every insert (the Railway
+            # proxy RTT dominates here, not CPU)
+
+            # Level 1: User (everything else hangs off user.id)
             test_user = User(
                 username="test_dj",
                 email="test@example.com",
@@ -90,8 +94,8 @@ async def test_model_operations():
             session.add(test_user)
             await session.flush()  # Get the user ID
             print(f"✅ User created: {test_user.id}")
-            
-            # Test Station creation
+
+            # Level 2: Station, Track, Playlist (only need user.id)
             test_station = Station(
                 name="Test Radio Station",
                 description="A test radio station",
@@ -100,11 +104,6 @@ async def test_model_operations():
                 genre="Electronic",
                 stream_url="https://stream.example.com/test"
             )
-            session.add(test_station)
-            await session.flush()
-            print(f"✅ Station created: {test_station.id}")
-            
-            # Test Track creation
             test_track = Track(
                 title="Test Track",
                 artist="Test Artist",
@@ -115,32 +114,24 @@ async def test_model_operations():
                 key="Am",
                 genre="House"
             )
-            session.add(test_track)
-            await session.flush()
-            print(f"✅ Track created: {test_track.id}")
-            
-            # Test Playlist creation
             test_playlist = Playlist(
                 name="Test Playlist",
                 description="A test playlist",
                 user_id=test_user.id,
                 is_public=True
             )
-            session.add(test_playlist)
+            session.add_all([test_station, test_track, test_playlist])
             await session.flush()
+            print(f"✅ Station created: {test_station.id}")
+            print(f"✅ Track created: {test_track.id}")
             print(f"✅ Playlist created: {test_playlist.id}")
-            
-            # Test PlaylistTrack creation
+
+            # Level 3: rows referencing the level-2 ids
             playlist_track = PlaylistTrack(
                 playlist_id=test_playlist.id,
                 track_id=test_track.id,
                 position=1
             )
-            session.add(playlist_track)
-            await session.flush()
-            print(f"✅ PlaylistTrack created: {playlist_track.id}")
-            
-            # Test StreamingSession creation  
             streaming_session = StreamingSession(
                 title="Test Stream Session",
                 description="A test streaming session",
@@ -150,11 +141,6 @@ async def test_model_operations():
                 bitrate=128000,  # 128 kbps
                 stream_key="test_stream_key_12345"
             )
-            session.add(streaming_session)
-            await session.flush()
-            print(f"✅ StreamingSession created: {streaming_session.id}")
-            
-            # Test DJSet creation
             dj_set = DJSet(
                 title="Test DJ Set",
                 description="A test DJ set",
@@ -165,10 +151,12 @@ async def test_model_operations():
                 file_path="/uploads/test-dj-set.mp3",
                 file_size=104857600  # 100MB
             )
-            session.add(dj_set)
+            session.add_all([playlist_track, streaming_session, dj_set])
             await session.flush()
+            print(f"✅ PlaylistTrack created: {playlist_track.id}")
+            print(f"✅ StreamingSession created: {streaming_session.id}")
             print(f"✅ DJSet created: {dj_set.id}")
-            
+
             # Commit all changes
             await session.commit()
             print("✅ All test records committed successfully")
@@ -187,33 +175,36 @@ async def test_relationships():
     
     async with AsyncSessionLocal() as session:
         try:
-            # Query with relationships
+            # Both relationship checks in one round-trip: each aggregation
+            # runs as a CTE (index scans on owner_id/uploader_id/playlist_id)
+            # and the UNION labels the rows
             result = await session.execute(text("""
-                SELECT u.username, s.name as station_name, COUNT(t.id) as track_count
-                FROM users u
-                LEFT JOIN stations s ON u.id = s.owner_id  
-                LEFT JOIN tracks t ON u.id = t.uploader_id
-                WHERE u.username = 'test_dj'
-                GROUP BY u.id, u.username, s.name
+                WITH user_summary AS (
+                    SELECT u.username AS label, s.name AS detail, COUNT(t.id) AS track_count
+                    FROM users u
+                    LEFT JOIN stations s ON u.id = s.owner_id
+                    LEFT JOIN tracks t ON u.id = t.uploader_id
+                    WHERE u.username = 'test_dj'
+                    GROUP BY u.id, u.username, s.name
+                ),
+                playlist_summary AS (
+                    SELECT p.name AS label, NULL AS detail, COUNT(pt.id) AS track_count
+                    FROM playlists p
+                    LEFT JOIN playlist_tracks pt ON p.id = pt.playlist_id
+                    WHERE p.name = 'Test Playlist'
+                    GROUP BY p.id, p.name
+                )
+                SELECT 'user' AS row_type, label, detail, track_count FROM user_summary
+                UNION ALL
+                SELECT 'playlist', label, detail, track_count FROM playlist_summary
             """))
-            
-            row = result.fetchone()
-            if row:
-                print(f"✅ User: {row[0]}, Station: {row[1]}, Tracks: {row[2]}")
-            
-            # Test playlist tracks
-            result = await session.execute(text("""
-                SELECT p.name, COUNT(pt.id) as track_count
-                FROM playlists p
-                LEFT JOIN playlist_tracks pt ON p.id = pt.playlist_id
-                WHERE p.name = 'Test Playlist'
-                GROUP BY p.id, p.name
-            """))
-            
-            row = result.fetchone()
-            if row:
-                print(f"✅ Playlist: {row[0]}, Track Count: {row[1]}")
-            
+
+            for row in result.fetchall():
+                if row[0] == 'user':
+                    print(f"✅ User: {row[1]}, Station: {row[2]}, Tracks: {row[3]}")
+                else:
+                    print(f"✅ Playlist: {row[1]}, Track Count: {row[3]}")
+
             return True
             
         except Exception as e:
@@ -227,15 +218,19 @@ async def cleanup_test_data():
     
     async with AsyncSessionLocal() as session:
         try:
-            # Delete in proper order to handle foreign keys
-            await session.execute(text("DELETE FROM playlist_tracks WHERE position = 1"))
-            await session.execute(text("DELETE FROM streaming_sessions WHERE title = 'Test Stream Session'"))
-            await session.execute(text("DELETE FROM dj_sets WHERE title = 'Test DJ Set'"))
-            await session.execute(text("DELETE FROM playlists WHERE name = 'Test Playlist'"))
-            await session.execute(text("DELETE FROM tracks WHERE title = 'Test Track'"))
-            await session.execute(text("DELETE FROM stations WHERE name = 'Test Radio Station'"))
-            await session.execute(text("DELETE FROM users WHERE username = 'test_dj'"))
-            
+            # One chained-CTE statement deletes everything in FK-safe order
+            # in a single round-trip instead of seven
+            await session.execute(text("""
+                WITH d1 AS (DELETE FROM playlist_tracks WHERE position = 1 RETURNING 1),
+                     d2 AS (DELETE FROM streaming_sessions WHERE title = 'Test Stream Session' RETURNING 1),
+                     d3 AS (DELETE FROM dj_sets WHERE title = 'Test DJ Set' RETURNING 1),
+                     d4 AS (DELETE FROM playlists WHERE name = 'Test Playlist' RETURNING 1),
+                     d5 AS (DELETE FROM tracks WHERE title = 'Test Track' RETURNING 1),
+                     d6 AS (DELETE FROM stations WHERE name = 'Test Radio Station' RETURNING 1),
+                     d7 AS (DELETE FROM users WHERE username = 'test_dj' RETURNING 1)
+                SELECT 1
+            """))
+
             await session.commit()
             print("✅ Test data cleaned up")
             